@@ -0,0 +1,104 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# =================================================================
+#
+# Authors: GeoCat BV <info@geocat.net>
+#
+# Copyright (c) 2021 Plateforme Géospatiale Canadienne (PGC) /
+#                    Canadian Geospatial Platform (CGP)
+#
+# Permission is hereby granted, free of charge, to any person
+# obtaining a copy of this software and associated documentation
+# files (the "Software"), to deal in the Software without
+# restriction, including without limitation the rights to use,
+# copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the
+# Software is furnished to do so, subject to the following
+# conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES
+# OF MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY,
+# WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR
+# OTHER DEALINGS IN THE SOFTWARE.
+#
+# =================================================================
+
+""" Optional compiled versions of GeoCoreProvider helpers.
+
+Build in-place with `python setup.py build_ext --inplace` (requires Cython).
+The provider falls back to the pure Python versions if this is not built.
+"""
+
+from re import compile
+from datetime import datetime
+
+# Keep in sync with DATE_REGEX in cgp.py
+DATE_REGEX = compile(r'(\d{4})-?(\d{0,2})-?(\d{0,2})[T| ]?(\d{0,2}):?(\d{0,2}):?(\d{0,2})')  # noqa
+
+
+cdef inline int _parse_digits(str text, Py_ssize_t start, Py_ssize_t count):
+    """ Returns the value of `count` ASCII digits in `text` from `start`
+    onwards, or -1 if any of them is not a digit.
+    """
+    cdef int result = 0
+    cdef int digit
+    cdef Py_ssize_t i
+    for i in range(start, start + count):
+        digit = ord(text[i]) - 48  # ord('0') == 48
+        if digit < 0 or digit > 9:
+            return -1
+        result = result * 10 + digit
+    return result
+
+
+cpdef str asisodate(object value):
+    """ Compiled version of GeoCoreProvider._parse_isodate. """
+    cdef str text, time_
+    cdef Py_ssize_t length
+    cdef int year, month, day
+    cdef int hour = 1, minute = 1, second = 1
+    cdef bint fast = False
+
+    if not isinstance(value, str):
+        return None
+    text = <str>value
+    length = len(text)
+
+    # Fast path: read the digits of the usual "YYYY-MM-DD[THH:MM:SS]" layout
+    time_ = '01:01:01'
+    if length >= 10 and text[4] == u'-' and text[7] == u'-':
+        year = _parse_digits(text, 0, 4)
+        month = _parse_digits(text, 5, 2)
+        day = _parse_digits(text, 8, 2)
+        fast = year >= 0 and month >= 0 and day >= 0
+        if fast and length > 10:
+            fast = text[10] == u'T' or text[10] == u' '
+            if fast and length > 11:
+                fast = length >= 19 and text[13] == u':' and text[16] == u':'
+                if fast:
+                    hour = _parse_digits(text, 11, 2)
+                    minute = _parse_digits(text, 14, 2)
+                    second = _parse_digits(text, 17, 2)
+                    fast = hour >= 0 and minute >= 0 and second >= 0
+                    time_ = text[11:19]
+
+    try:
+        if fast:
+            dt = datetime(year, month, day, hour, minute, second)
+            isodate = f'{text[:10]}T{time_}Z'
+        else:
+            matches = DATE_REGEX.match(text)
+            dt = datetime(*[int(i) if i else 1 for i in matches.groups()])
+            isodate = f'{dt.isoformat()}Z'
+    except (ValueError, TypeError, AttributeError):
+        return None
+    if dt.year == 1:
+        # Treat dates like "0001-01-01" as an invalid date
+        return None
+    return isodate
@@ -1,11 +1,49 @@
-import os
 import json
-import codecs
 import logging
+from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from re import compile
 from datetime import datetime
+from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+try:
+    # Use a faster JSON parser if available
+    import orjson as fastjson
+except ImportError:
+    try:
+        import ujson as fastjson
+    except ImportError:
+        fastjson = json
+
+try:
+    # Stream-parse geoCore responses if available
+    import ijson
+    from ijson.common import ObjectBuilder
+except ImportError:
+    ijson = None
+
+try:
+    # Compute bounding boxes of large geometries in C if available
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # JIT-compile the bounding box reduction if available (requires NumPy)
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    # Use the compiled helpers if the Cython extension was built
+    from geocore_pygeoapi.provider import _speedups
+except ImportError:
+    _speedups = None
 
 from pygeoapi import l10n
 from pygeoapi.provider.base import (
@@ -16,14 +54,73 @@ from pygeoapi.provider.base import (
     ProviderItemNotFoundError
 )
 
-JSON_REGEX = {
-    'posix': compile(r'("\\"\\".+?\\"\\"")'),
-    'nt': compile(r'("\"\".+?\"\"")')
-}
+# geoCore request (connect, read) timeouts in seconds
+REQUEST_TIMEOUT = (5, 30)
+# Maximum number of keep-alive connections per host and of parallel
+# geoCore page requests (for all threads and provider instances)
+POOL_SIZE = 32
+# NumPy only beats pure Python for geometries with more vertices than this
+NUMPY_MIN_VERTICES = 32
 DATE_REGEX = compile(r'(\d{4})-?(\d{0,2})-?(\d{0,2})[T| ]?(\d{0,2}):?(\d{0,2}):?(\d{0,2})')  # noqa
 
+# Splits comma-separated strings and trims the whitespace around the items
+LIST_REGEX = compile(r'\s*,\s*')
+# Matches the key-value pairs of geoCore's "{key1=value1, key2=value2}" strings  # noqa
+DICT_REGEX = compile(r'([^=,{}]+)=([^=,{}]*)')
+
+# GeoJSON features are shallow copies of this (keys in output order)
+FEATURE_TEMPLATE = {
+    'type': 'Feature',
+    'geometry': None,
+    'id': None,
+    'properties': None
+}
+
 LOGGER = logging.getLogger(__name__)
 
+# HTTP session that pools (keep-alive) connections for all provider instances
+SESSION = requests.Session()
+ADAPTER = HTTPAdapter(pool_connections=10, pool_maxsize=POOL_SIZE,
+                      max_retries=Retry(total=2, backoff_factor=0.2))
+SESSION.mount('https://', ADAPTER)
+SESSION.mount('http://', ADAPTER)
+
+# Worker threads for parallel page requests (created on demand)
+EXECUTOR = ThreadPoolExecutor(POOL_SIZE, thread_name_prefix='geocore')
+
+if njit:
+    @njit
+    def _bbox_kernel(arr):
+        """ Returns the (minx, miny, maxx, maxy) of an N x 2 float array. """
+        minx = maxx = arr[0, 0]
+        miny = maxy = arr[0, 1]
+        for i in range(1, arr.shape[0]):
+            x = arr[i, 0]
+            y = arr[i, 1]
+            minx = min(x, minx)
+            miny = min(y, miny)
+            maxx = max(x, maxx)
+            maxy = max(y, maxy)
+        return minx, miny, maxx, maxy
+
+    # Compile when the module loads instead of on the first request
+    _bbox_kernel(np.zeros((4, 2)))
+else:
+    _bbox_kernel = None
+
+
+class _RecordingReader:
+    """ File-like wrapper that keeps a copy of all bytes read from `raw`. """
+
+    def __init__(self, raw):
+        self._raw = raw
+        self.buffer = bytearray()
+
+    def read(self, size=-1):
+        data = self._raw.read(size)
+        self.buffer += data
+        return data
+
 
 class GeoCoreProvider(BaseProvider):
     """ Provider for the Canadian Federal Geospatial Platform (FGP).
@@ -48,91 +145,206 @@ class GeoCoreProvider(BaseProvider):
         LOGGER.debug('map endpoints to provider methods')
         mapping = self.data.get('mapping', {})
         if not mapping:
-            LOGGER.warning(f'No endpoint mapping found for {self.name} provider: using defaults')  # noqa
+            LOGGER.warning('No endpoint mapping found for %s provider: using defaults', self.name)  # noqa
         self._query_url = f'{self._baseurl}{mapping.get(self.query.__name__, "geo")}'  # noqa
         self._get_url = f'{self._baseurl}{mapping.get(self.get.__name__, "id")}'
 
-        LOGGER.debug('get queryable field info')
-        self.fields = self.data.get('queryables', {})
-        LOGGER.debug(f'Queryables: {self.fields}')
+        # pygeoapi creates a provider per request: share the pooled session
+        self._session = SESSION
 
-    @property
-    def _iswin(self):
-        """ Returns True if the interpreter runs on Windows. """
-        return os.name == 'nt'
+        # geoCore wants ISO 639-1 language codes
+        self._lang = self.locale.language if self.locale else None
+        LOGGER.debug("Requesting geoCore responses in '%s'", self._lang)
 
-    @property
-    def _getregex(self):
-        """ Returns the compiled regex pattern for JSON strings
-        suitable for the current platform (POSIX or Windows). """
-        return JSON_REGEX[os.name]
+        # geoCore search results larger than this are fetched in parallel pages  # noqa
+        self._page_size = self.data.get('page_size')
 
-    def _parse_json(self, body):
-        """ Parses the geoCore response body as a JSON object. """
+        # Also add the spatial extent to features if skip_geometry is set
+        self._needs_extent = self.data.get('needs_extent', False)
 
-        def unescape(match):
-            """ Unescape string and replace double quotes with single ones. """
-            unescaped = codecs.escape_decode(match.group(0))[0].decode()  # noqa
-            if not self._iswin:
-                unescaped = unescaped.replace('\\', '')
-            return unescaped.replace('""', '"').strip('"')
+        LOGGER.debug('get queryable field info')
+        self.fields = self.data.get('queryables', {})
+        LOGGER.debug('Queryables: %s', self.fields)
 
+    def _parse_json(self, body):
+        """ Parses the geoCore response body (bytes) as a JSON object. """
         result = {}
         if not body:
             return result
 
-        # geoCore returns some JSON array values as encoded JSON strings
-        # Python's JSON loader does not like them, so we have to replace those
         LOGGER.debug('parse JSON response body')
-        json_str = self._getregex.sub(unescape, body)
         try:
-            result = json.loads(json_str)
-        except json.JSONDecodeError as err:
-            LOGGER.error('Failed to parse JSON response', exc_info=err)
-            return result
+            # All supported JSON libraries raise a ValueError subclass
+            result = fastjson.loads(body)
+        except ValueError:
+            try:
+                # The standard library is more lenient (e.g. NaN, big ints)
+                result = json.loads(body)
+            except ValueError as err:
+                LOGGER.error('Failed to parse JSON response', exc_info=err)
+                return result
 
         # check if geoCore's response has Items or an error
         if 'Items' not in result:
             error = result.get('errorMessage', 'missing Items object')
             raise ProviderInvalidQueryError(error)
 
+        # geoCore returns some JSON array values as encoded JSON strings
+        result['Items'] = [
+            self._unescape_item(item) for item in result['Items'] or []
+            if isinstance(item, dict)
+        ]
+
         return result
 
-    @staticmethod
-    def _asisodate(value):
+    @classmethod
+    def _asisodate(cls, value):
         """ Returns an ISO formatted timestamp (with Z suffix) from a string.
         If the value can't be turned into a date, `None` will be returned.
         """
+        if not isinstance(value, str):
+            return None
+        return cls._parse_isodate(value)
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_isodate(value):
+        """ Returns an ISO formatted timestamp for the date string `value`.
+        Results are cached, as many records share the same dates.
+        """
         try:
-            matches = DATE_REGEX.match(value)
-            dt = datetime(*(int(i) if i else 1 for i in matches.groups()))
+            # Fast path: slice the usual "YYYY-MM-DD[THH:MM:SS]" layout
+            date_ = value[:10]
+            time_ = value[11:19] or '01:01:01'
+            digits = date_[:4] + date_[5:7] + date_[8:] + \
+                time_[:2] + time_[3:5] + time_[6:]
+            if (len(digits) == 14 and digits.isascii() and digits.isdigit()
+                    and date_[4] == date_[7] == '-'
+                    and time_[2] == time_[5] == ':'
+                    and (len(value) == 10 or value[10] in 'T ')):
+                dt = datetime(int(date_[:4]), int(date_[5:7]),
+                              int(date_[8:]), int(time_[:2]),
+                              int(time_[3:5]), int(time_[6:]))
+                isodate = f'{date_}T{time_}Z'
+            else:
+                matches = DATE_REGEX.match(value)
+                dt = datetime(*(int(i) if i else 1 for i in matches.groups()))
+                isodate = f'{dt.isoformat()}Z'
         except (ValueError, TypeError, AttributeError):
             return None
         if dt.year == 1:
             # Treat dates like "0001-01-01" as an invalid date
             return None
-        return f'{dt.isoformat()}Z'
+        return isodate
 
-    def _request_json(self, url, params):
-        """ Performs a GET request on `url` and returns the JSON response. """
+    if _speedups:
+        _parse_isodate = staticmethod(lru_cache(maxsize=4096)(_speedups.asisodate))  # noqa
+
+    def _request(self, url, params, stream=False):
+        """ Performs a GET request on `url` and returns the response. """
         response = None
-        if 'lang' not in params and self.locale:
-            # Add language parameter, if missing (geoCore wants ISO 639-1 codes)  # noqa
-            LOGGER.debug(f"Requesting geoCore response in '{self.locale.language}'")  # noqa
-            params['lang'] = self.locale.language
+        if self._lang and 'lang' not in params:
+            # Add language parameter, if missing (without changing `params`)
+            params = {'lang': self._lang, **params}
         try:
-            response = requests.get(url, params)
+            response = self._session.get(url, params=params, stream=stream,
+                                         timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
         except requests.HTTPError as err:
             LOGGER.error(err)
             raise ProviderQueryError(
                 f'failed to query {response.url if response else url}')
-        except requests.ConnectionError as err:
+        except (requests.ConnectionError, requests.Timeout) as err:
             LOGGER.error(err)
             raise ProviderConnectionError(
                 f'failed to connect to {response.url if response else url}')
 
-        return self._parse_json(response.text)
+        return response
+
+    def _request_json(self, url, params):
+        """ Performs a GET request on `url` and returns the JSON response. """
+        response = self._request(url, params)
+
+        # geoCore always returns UTF-8: skip the charset detection of .text
+        return self._parse_json(response.content)
+
+    def _request_many(self, requests_):
+        """ Performs the GET requests for all (url, params) tuples in
+        `requests_` in parallel and returns the JSON responses in order.
+        """
+        return list(EXECUTOR.map(lambda r: self._request_json(*r), requests_))
+
+    def _request_items(self, url, params):
+        """ Performs a streaming GET request on `url` and returns the items
+        of the JSON response, parsed while it is being downloaded
+        (requires ijson).
+        """
+        error = 'missing Items object'
+        has_items = False
+        builder = None
+        items = []
+
+        with self._request(url, params, stream=True) as response:
+            # Let urllib3 decompress gzipped responses
+            response.raw.decode_content = True
+            # Keep the body for the buffered parser if streaming fails
+            body = _RecordingReader(response.raw)
+            events = ijson.parse(body, use_float=True)
+            try:
+                try:
+                    for prefix, event, value in events:
+                        if builder:
+                            builder.event(event, value)
+                            if prefix == 'Items.item' and event == 'end_map':
+                                items.append(
+                                    self._unescape_item(builder.value))
+                                builder = None
+                        elif prefix == 'Items.item' and event == 'start_map':
+                            builder = ObjectBuilder()
+                            builder.event(event, value)
+                        elif prefix == 'Items':
+                            has_items = True
+                        elif prefix == 'errorMessage':
+                            error = value
+                except ijson.JSONError as err:
+                    LOGGER.warning('Failed to stream-parse JSON response: %s',
+                                   err)
+                    # Read the rest of the body
+                    body.read()
+                    items = None
+            except (ProtocolError, ReadTimeoutError,
+                    requests.RequestException) as err:
+                LOGGER.error(err)
+                raise ProviderConnectionError(
+                    f'failed to connect to {response.url}')
+
+        if items is None:
+            # ijson is strict (e.g. about NaN): parse the body again with the
+            # buffered (lenient) parser, which also logs if it is invalid
+            return self._parse_json(bytes(body.buffer)).get('Items') or []
+
+        # check if geoCore's response had Items or an error
+        if not has_items:
+            raise ProviderInvalidQueryError(error)
+
+        return items
+
+    @staticmethod
+    def _unescape_item(item):
+        """ Parses the item values that geoCore returned as encoded JSON
+        strings (e.g. '""[...]""') and replaces them in-place.
+        """
+        for key, value in item.items():
+            if not (isinstance(value, str) and value.startswith('""')
+                    and value.endswith('""')):
+                continue
+            # Slice off the outer quotes instead of stripping all of them
+            value = value[2:-2]
+            try:
+                item[key] = fastjson.loads(value.replace('""', '"'))
+            except ValueError as err:
+                LOGGER.warning('failed to parse %s value: %s', key, err)
+        return item
 
     @staticmethod
     def _getcoords(item):
@@ -141,37 +353,52 @@ class GeoCoreProvider(BaseProvider):
         if isinstance(coords, list):
             return coords
         try:
-            return json.loads(coords)
-        except json.JSONDecodeError as err:
-            LOGGER.warning(f'failed to parse coords: {err}')
+            return fastjson.loads(coords)
+        except ValueError as err:
+            LOGGER.warning('failed to parse coords: %s', err)
         return []
 
     @staticmethod
-    def _aslist(value, delim=','):
-        """ Converts a `delim`-separated string `value` into a list. """
-        return [v.strip() for v in (value or '').split(delim) if v.strip()]
+    def _aslist(value):
+        """ Converts a comma-separated string `value` into a list. """
+        return [v for v in LIST_REGEX.split((value or '').strip()) if v]
 
     @staticmethod
-    def _asdict(value, item_delim=',', pair_delim='='):
-        """ Converts string `value` into a dictionary if possible.
-
-        :param value:       The string value to convert.
-        :param item_delim:  The delimiter used to separate dict items.
-        :param pair_delim:  The delimiter used to separate key-value pairs.
+    def _asdict(value):
+        """ Converts a "{key1=value1, key2=value2}" string `value` into a
+        dictionary if possible. Items without a key are ignored.
         """
-        if not value or pair_delim not in value:
+        if not value or '=' not in value:
             return {}
         return {
-            k.strip(): v.strip()
-            for k, v in (
-                p.split(pair_delim)[:2]
-                for p in value.strip('{}').split(item_delim)
-            )
+            m.group(1).strip(): m.group(2).strip()
+            for m in DICT_REGEX.finditer(value)
         }
 
     @staticmethod
     def _getbbox(coords):
-        """ Creates a bounding box array from a coordinate list. """
+        """ Creates a bounding box array from a coordinate list.
+        The values are always floats, whichever path computed them.
+        """
+        num_vertices = sum(len(part) for part in coords)
+        if num_vertices == 1:
+            # Degenerate (single point) geometry
+            x, y = next(part for part in coords if part)[0]
+            x, y = float(x), float(y)
+            return [x, y, x, y]
+        if np and num_vertices >= NUMPY_MIN_VERTICES:
+            # Copy the values of all rings into one N x 2 array
+            # (NumPy raises a ValueError for rings with mixed vertex sizes)
+            arr = np.concatenate([
+                np.asarray(part, dtype=np.float64) for part in coords if part
+            ])
+            if arr.ndim != 2 or arr.shape[1] != 2:
+                # Only accept (x, y) vertices, like the pure Python loop
+                raise ValueError(f'expected 2D vertices, got {arr.shape}')
+            if _bbox_kernel:
+                return list(_bbox_kernel(arr))
+            return arr.min(axis=0).tolist() + arr.max(axis=0).tolist()
+
         minx = float('NaN')
         miny = float('NaN')
         maxx = float('NaN')
@@ -182,54 +409,79 @@ class GeoCoreProvider(BaseProvider):
                 miny = min(y, miny)
                 maxx = max(x, maxx)
                 maxy = max(y, maxy)
-        return [minx, miny, maxx, maxy]
-
-    def _gettimerange(self, temporal):
-        """ Converts a temporal extent string into a list of [begin, end]. """
-        t_extent = self._asdict(temporal)
-        begin = self._asisodate(t_extent.get('begin'))
-        end = self._asisodate(t_extent.get('end'))
-        return [begin, end]
+        return [float(minx), float(miny), float(maxx), float(maxy)]
+
+    @classmethod
+    def _gettimerange(cls, temporal):
+        """ Converts a temporal extent string into a (begin, end) tuple. """
+        if not isinstance(temporal, str):
+            return None, None
+        return cls._parse_timerange(temporal)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _parse_timerange(cls, temporal):
+        """ Returns the (begin, end) tuple of a temporal extent string.
+        Results are cached, as many records share the same extent.
+        """
+        t_extent = cls._asdict(temporal)
+        begin = cls._asisodate(t_extent.get('begin'))
+        end = cls._asisodate(t_extent.get('end'))
+        return begin, end
 
     def _getextent(self, coords, temporal):
         """ Returns an OGC-API records spatial and temporal extent object.
 
-        :param coords:      A coordinate list.
+        :param coords:      A coordinate list. If `None`, only the
+                            temporal extent is returned.
         :param temporal:    A temporal extent string formatted as
                             "{begin=YYYY-MM-DD, end=YYYY-MM_DD}".
         :returns:           An OGC-API GeoJSON extent dict.
         """
 
-        bbox = self._getbbox(coords)
-        interval = self._gettimerange(temporal)
-
-        return {
-            'spatial': {
-                'bbox': [[bbox]],
+        extent = {}
+        if coords is not None:
+            extent['spatial'] = {
+                'bbox': [[self._getbbox(coords)]],
                 'crs': 'http://www.opengis.net/def/crs/OGC/1.3/CRS84'
-            },
-            'temporal': {
-                'interval': interval,
-                'trs': 'http://www.opengis.net/def/uom/ISO-8601/0/Gregorian'
             }
+        extent['temporal'] = {
+            'interval': list(self._gettimerange(temporal)),
+            'trs': 'http://www.opengis.net/def/uom/ISO-8601/0/Gregorian'
         }
+        return extent
 
-    def _to_geojson(self, json_obj, skip_geometry=False, single_feature=False):
-        """ Turns a regular geoCore JSON object into GeoJSON. """
+    def _to_geojson(self, items, skip_geometry=False, single_feature=False):
+        """ Turns an iterable of regular geoCore JSON items into GeoJSON. """
         features = []
         num_matched = None
 
-        for item in json_obj.get('Items', []):
-            feature = {
-                'type': 'Feature',
-                'geometry': None
-            }
-
+        # Resolve locale-dependent values once for all items
+        locale = self.locale
+        translate_struct = l10n.translate_struct
+        translate = l10n.translate
+        hreflang = l10n.locale2str(locale) if \
+            isinstance(locale, l10n.Locale) else locale
+        lang_index = 0 if locale and locale.language == 'en' else 1
+
+        # Bind helpers to locals to skip attribute lookups for every item
+        asisodate = self._asisodate
+        aslist = self._aslist
+        getcoords = self._getcoords
+        getextent = self._getextent
+        add_feature = features.append
+        new_feature = FEATURE_TEMPLATE.copy
+        log_debug = LOGGER.debug
+        log_warning = LOGGER.warning
+        needs_extent = self._needs_extent
+
+        for item in items:
             # Get ID and validate it
             id_ = item.pop('id', None)
             if id_ is None:
-                LOGGER.warning(f'skipped record without ID')
+                log_warning('skipped record without ID')
                 continue
+            feature = new_feature()
             feature['id'] = id_
             item['externalId'] = id_
 
@@ -237,50 +489,65 @@ class GeoCoreProvider(BaseProvider):
             num_matched = int(item.pop('total', 0))
 
             # Rename and set/fix date properties
-            date_created = self._asisodate(item.get('created'))
-            date_updated = self._asisodate(item.pop('published', None))
+            date_created = asisodate(item.get('created'))
+            date_updated = asisodate(item.pop('published', None))
             item['record-created'] = date_created
             item['record-updated'] = date_updated
             item['created'] = date_created
             item['updated'] = date_updated
 
             # Convert keywords to an array
-            item['keywords'] = self._aslist(item.get('keywords'))
+            item['keywords'] = aslist(item.get('keywords'))
 
             # Get coordinates and set geometry and extent
-            coords = self._getcoords(item)
-            if coords:
-                if skip_geometry:
-                    LOGGER.debug('skipped geometry')
-                else:
-                    # Add Polygon geometry to feature
-                    feature['geometry'] = {
-                        'type': 'Polygon',
-                        'coordinates': coords
-                    }
-
-                # Add extent object to feature
-                item['extent'] = self._getextent(
-                    coords,
-                    item.pop('temporalExtent', None)
-                )
+            if skip_geometry and not needs_extent:
+                # Do not parse the coordinates or compute the bbox at all,
+                # but keep the (cached) temporal extent of the record
+                if item.pop('coordinates', None):
+                    item['extent'] = getextent(
+                        None,
+                        item.pop('temporalExtent', None)
+                    )
             else:
-                LOGGER.debug('record has no coordinates: '
-                             'cannot set geometry and extent')
+                coords = getcoords(item)
+                if coords:
+                    if not skip_geometry:
+                        # Add Polygon geometry to feature
+                        feature['geometry'] = {
+                            'type': 'Polygon',
+                            'coordinates': coords
+                        }
+
+                    # Add extent object to feature
+                    item['extent'] = getextent(
+                        coords,
+                        item.pop('temporalExtent', None)
+                    )
+                else:
+                    log_debug('record has no coordinates: '
+                              'cannot set geometry and extent')
 
             # Remove options and convert to associations
             options = item.pop('options', [])
+            associations = []
             for opt in options:
-                opt = l10n.translate_struct(opt, self.locale)
+                # Only translate the used values: translate_struct deep-copies
                 url = opt.get('url')
                 title = opt.get('name')
                 type_ = opt.get('protocol')
-                rel = 'item'
-                i18n = self.locale
                 desc = opt.get('description')
-                if desc and desc.count(';') == 2:
-                    # TODO: retrieve mime type from URL or lookup
-                    rel, type_, i18n = desc.split(';')
+                if locale:
+                    url = translate(url, locale)
+                    title = translate(title, locale)
+                    type_ = translate(type_, locale)
+                    desc = translate(desc, locale)
+                rel = 'item'
+                i18n = hreflang
+                if desc and ';' in desc:
+                    parts = desc.split(';')
+                    if len(parts) == 3:
+                        # TODO: retrieve mime type from URL or lookup
+                        rel, type_, i18n = parts
                 if not (type_ and url):
                     # Do not add links without a type or URL
                     continue
@@ -289,23 +556,24 @@ class GeoCoreProvider(BaseProvider):
                     'type': type_,
                     'rel': rel,
                     'title': title,
-                    'hreflang': l10n.locale2str(i18n) if
-                    isinstance(i18n, l10n.Locale) else i18n
+                    'hreflang': i18n
                 }
-                item.setdefault('associations', []).append(lnk)
+                associations.append(lnk)
+            if associations:
+                item['associations'] = associations
 
             # Remove graphicOverview and promote/set first thumbnailUrl
             try:
                 url = item.pop('graphicOverview')[0].get('overviewfilename')
                 item['thumbnailUrl'] = url
             except (KeyError, IndexError, AttributeError):
-                LOGGER.warning('could not find overview thumbnail')
+                log_warning('could not find overview thumbnail')
 
             # Translate contacts, credits and distributors lists
             for prop in ('contact', 'credits', 'distributor'):
                 values = item.get(prop, [])
                 if values:
-                    item[prop] = l10n.translate_struct(values, self.locale)
+                    item[prop] = translate_struct(values, locale)
 
             # Translate known concatenated "en; fr" values
             # TODO: add more props if needed, improve on geoCore side
@@ -314,11 +582,11 @@ class GeoCoreProvider(BaseProvider):
                 values = [v.strip() for v in item.get(prop, '').split(';')]
                 if len(values) != 2:
                     continue
-                item[prop] = values[0 if self.locale.language == 'en' else 1]
+                item[prop] = values[lang_index]
 
             # Set properties and add to feature list
             feature['properties'] = item
-            features.append(feature)
+            add_feature(feature)
 
         if features and single_feature == 1:
             LOGGER.debug('returning single feature')
@@ -330,7 +598,7 @@ class GeoCoreProvider(BaseProvider):
             'features': features,
             'numberReturned': len(features)
         }
-        LOGGER.debug(f'provider said there are {num_matched} matches')
+        LOGGER.debug('provider said there are %s matches', num_matched)
         if num_matched:
             collection['numberMatched'] = num_matched
         return collection
@@ -358,8 +626,8 @@ class GeoCoreProvider(BaseProvider):
 
         if resulttype != 'results':
             # Supporting 'hits' will require a change on the geoCore API
-            LOGGER.warning(f'Unsupported resulttype {resulttype}: '
-                           f'defaulting to "results"')
+            LOGGER.warning('Unsupported resulttype %s: '
+                           'defaulting to "results"', resulttype)
 
         if bbox:
             LOGGER.debug('processing bbox parameter')
@@ -379,20 +647,37 @@ class GeoCoreProvider(BaseProvider):
 
         # Set queryables
         if properties:
-            LOGGER.debug(f'Adding queryables: {properties}')
+            LOGGER.debug('Adding queryables: %s', properties)
             for k, v in properties:
                 params[k] = v
 
         # Set text-based search
         if q:
-            LOGGER.debug(f'Adding free-text search: {q}')
+            LOGGER.debug('Adding free-text search: %s', q)
             params['keyword'] = q
 
-        LOGGER.debug(f'querying {self._query_url}')
-        json_obj = self._request_json(self._query_url, params)
+        LOGGER.debug('querying %s', self._query_url)
+        if self._page_size and limit > self._page_size:
+            LOGGER.debug('fetching %s records in pages of %s',
+                         limit, self._page_size)
+            pages = [
+                (self._query_url, {**params, 'min': first, 'max': min(
+                    first + self._page_size - 1, params['max'])})
+                for first in range(params['min'], params['max'] + 1,
+                                   self._page_size)
+            ]
+            items = chain.from_iterable(
+                json_obj.get('Items') or []
+                for json_obj in self._request_many(pages)
+            )
+        elif ijson:
+            items = self._request_items(self._query_url, params)
+        else:
+            json_obj = self._request_json(self._query_url, params)
+            items = json_obj.get('Items') or []
 
         LOGGER.debug('turn geoCore JSON into GeoJSON')
-        return self._to_geojson(json_obj, skip_geometry)
+        return self._to_geojson(items, skip_geometry)
 
     def get(self, identifier):
         """ Request a single geoCore record by ID.
@@ -406,14 +691,15 @@ class GeoCoreProvider(BaseProvider):
             'id': identifier
         }
 
-        LOGGER.debug(f'querying {self._get_url}')
+        LOGGER.debug('querying %s', self._get_url)
         json_obj = self._request_json(self._get_url, params)
 
-        if not json_obj.get('Items', []):
+        items = json_obj.get('Items', [])
+        if not items:
             raise ProviderItemNotFoundError(f'record id {identifier} not found')  # noqa
 
         LOGGER.debug('turn geoCore JSON into GeoJSON')
-        return self._to_geojson(json_obj, single_feature=True)
+        return self._to_geojson(items, single_feature=True)
 
     def __repr__(self):
         return f'<{self.__class__.__name__}> {self.data}'
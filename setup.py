@@ -30,7 +30,8 @@
 
 import io
 import os
-from setuptools import find_packages, setup
+from setuptools import Extension, find_packages, setup
+from setuptools.command.build_ext import build_ext
 import re
 
 
@@ -59,6 +60,33 @@ DESCRIPTION = 'CGP pygeoapi plugin'
 if os.path.exists('MANIFEST'):
     os.unlink('MANIFEST')
 
+
+class OptionalBuildExt(build_ext):
+    """build the C extensions if possible, skip them otherwise"""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as err:
+            print(f'Skipping the C extensions: {err}')
+
+    def build_extension(self, ext):
+        # Catch all errors: missing compiler (setuptools errors), missing
+        # Cython or a failed Cython compile (Cython's own CompileError)
+        try:
+            super().build_extension(ext)
+        except Exception as err:
+            print(f'Failed to build the {ext.name} C extension: {err}')
+
+
+# The compiled provider helpers are optional: setuptools cythonizes them at
+# build time if Cython is installed, and the provider falls back on the pure
+# Python versions if they could not be built
+EXT_MODULES = [
+    Extension('geocore_pygeoapi.provider._speedups',
+              ['geocore_pygeoapi/provider/_speedups.pyx'])
+]
+
 setup(
     name='geocore-pygeoapi',
     version=get_package_version(),
@@ -89,6 +117,8 @@ setup(
     url='https://github.com/Canadian-Geospatial-Platform/geocore-pygeoapi',
 #    install_requires=read('requirements.txt').splitlines(),
     packages=find_packages(),
+    ext_modules=EXT_MODULES,
+    cmdclass={'build_ext': OptionalBuildExt},
     include_package_data=True,
     classifiers=[
         'Development Status :: 4 - Beta',